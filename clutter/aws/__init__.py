@@ -1,6 +1,6 @@
 from . import common, s3, secrets_manager, sqs
 from .common import session_maker
-from .secrets_manager import get_secrets, list_secrets
+from .secrets_manager import get_secrets, get_secrets_many, list_secrets
 from .ssm import get_parameters, list_parameters, set_parameters
 
 __all__ = ["common", "s3", "sqs", "secrets_manager"]
@@ -1,7 +1,19 @@
+import functools
+import threading
+import time
+
 import boto3
+from botocore.config import Config
 
 from .. import docker
 
+# shared botocore config - keep-alive keeps pooled connections warm between calls
+BOTO_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=32,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+)
+
 SESSION_OPTS = {
     "aws_access_key_id": None,
     "aws_secret_access_key": None,
@@ -52,6 +64,84 @@ def session_maker(
     return boto3.session.Session(**session_opts)
 
 
+# create client, cached per (service, credentials, region)
+@functools.lru_cache(maxsize=32)
+def client_maker(
+    service_name,
+    profile_name=None,
+    aws_access_key_id=None,
+    aws_secret_access_key=None,
+    region_name="ap-northeast-2",
+    load_docker_secret=True,
+):
+    """Create boto3 client, reusing the session and connection pool across calls.
+
+    Building a session per call pays credential resolution and a fresh TLS
+    handshake every time - cache the client process-wide instead.
+    """
+    session = session_maker(
+        profile_name=profile_name,
+        aws_access_key_id=aws_access_key_id,
+        aws_secret_access_key=aws_secret_access_key,
+        region_name=region_name,
+        load_docker_secret=load_docker_secret,
+    )
+    return session.client(service_name, config=BOTO_CONFIG)
+
+
+# stale-while-revalidate cache (used by get_secrets / get_parameters)
+CACHE_TTL = 300  # seconds a cached value is served as-is
+CACHE_STALE = 900  # seconds a cached value may still be served while refreshing
+
+_swr_cache = {}  # key -> (fetched_at, value)
+_swr_locks = {}
+_swr_locks_guard = threading.Lock()
+
+
+def _swr_lock(key):
+    with _swr_locks_guard:
+        if key not in _swr_locks:
+            _swr_locks[key] = threading.Lock()
+        return _swr_locks[key]
+
+
+def swr_get(key, fetch, ttl=CACHE_TTL, stale=CACHE_STALE):
+    """Get a value through the stale-while-revalidate cache.
+
+    Fresh hit returns from memory, stale hit (ttl < age < stale) returns the
+    cached value and refreshes in a background thread, anything older (or a
+    miss) fetches synchronously. One refresher per key at a time.
+    """
+    now = time.time()
+    entry = _swr_cache.get(key)
+    if entry is not None:
+        fetched_at, value = entry
+        age = now - fetched_at
+        if age < ttl:
+            return value
+        if age < stale:
+            lock = _swr_lock(key)
+            if lock.acquire(blocking=False):
+
+                def _refresh():
+                    try:
+                        _swr_cache[key] = (time.time(), fetch())
+                    finally:
+                        lock.release()
+
+                threading.Thread(target=_refresh, daemon=True).start()
+            return value
+
+    # miss or too stale - fetch synchronously, single flight per key
+    with _swr_lock(key):
+        entry = _swr_cache.get(key)
+        if entry is not None and time.time() - entry[0] < ttl:
+            return entry[1]
+        value = fetch()
+        _swr_cache[key] = (time.time(), value)
+        return value
+
+
 def validate_response(response, success_codes=[200]):
     meta = response["ResponseMetadata"]
     if meta["HTTPStatusCode"] not in success_codes:
@@ -1,16 +1,22 @@
-import ast
 import base64
 import fnmatch
 import json
 import logging
+import re
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union
 
 import boto3
 from botocore.exceptions import ClientError
-from rich import print
 
-from .common import session_maker
+from .common import BOTO_CONFIG, client_maker, swr_get
+
+# orjson is ~2-5x faster than stdlib json and raises a json.JSONDecodeError subclass
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
 
 logger = logging.getLogger(__file__)
 
@@ -33,12 +39,18 @@ def _get_secrets(client, secret_name):
     else:
         if "SecretString" in get_secret_value_response:
             secrets = get_secret_value_response["SecretString"]
-            try:
-                secrets = json.loads(secrets)
-            except json.JSONDecodeError:
-                secrets = ast.literal_eval(secrets)
-            except Exception as ex:
-                logger.error(f"[CLUTTER] Cannot Decode JSON, {secrets}")
+            # cheap sniff on the first byte - plain strings skip the decode
+            # attempt entirely instead of paying for a raised JSONDecodeError
+            head = secrets.lstrip()[:1]
+            if head and head in "{[\"0123456789-tfn'":
+                try:
+                    secrets = _json.loads(secrets)
+                except json.JSONDecodeError:
+                    import ast  # lazy - only needed for non-JSON payloads
+
+                    secrets = ast.literal_eval(secrets)
+                except Exception as ex:
+                    logger.error(f"[CLUTTER] Cannot Decode JSON, {secrets}")
         else:
             secrets = base64.b64decode(get_secret_value_response["SecretBinary"])
 
@@ -62,45 +74,54 @@ def list_secrets(
     (TODO)
       - filter tags
     """
+    # lazy - rich (and its transitive pygments) is only needed for pretty listing
+    from rich import print
+
     # correct args
     if patterns:
         patterns = patterns if isinstance(patterns, (tuple, list)) else [patterns]
 
     # get client
-    session = session or session_maker(
-        profile_name=profile_name,
-        aws_access_key_id=aws_access_key_id,
-        aws_secret_access_key=aws_secret_access_key,
-        region_name=region_name,
-        load_docker_secret=load_docker_secret,
-    )
-    client = session.client("secretsmanager")
-
-    # get secrets
-    opts = {"MaxResults": 100}
-    secrets = []
-    while True:
-        response = client.list_secrets(**opts)
-        secrets += response.get("SecretList", [])
-        next_token = response.get("NextToken")
-        if next_token is None:
-            break
-        opts.update({"NextToken": next_token})
-
-    for secret in secrets:
-        secret_name = secret["Name"]
-        if not any([fnmatch.fnmatch(secret_name, f"*{pat.strip('*')}*") for pat in patterns]):
-            continue
-        body = _get_secrets(client, secret_name)
-        print(f"[[bold]{secret['Name']}[/bold]]")
-        if secret.get("Description"):
-            print(f" DESCRIPTION: {secret['Description']}")
-        print(" VALUES:")
-        if isinstance(body, dict):
-            for k, v in body.items():
-                print(f"  - {k}: {v}")
-        else:
-            print(f"  - {body}")
+    if session is not None:
+        client = session.client("secretsmanager", config=BOTO_CONFIG)
+    else:
+        client = client_maker(
+            "secretsmanager",
+            profile_name=profile_name,
+            aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key,
+            region_name=region_name,
+            load_docker_secret=load_docker_secret,
+        )
+
+    # get secrets (server-side name filter, no round-trip for non-matching secrets)
+    paginate_opts = {"PaginationConfig": {"PageSize": 100}}
+    filter_values = [pat.strip("*") for pat in patterns if pat.strip("*")]
+    if filter_values:
+        paginate_opts.update({"Filters": [{"Key": "name", "Values": filter_values}]})
+
+    # one compiled regex instead of per-item fnmatch calls (which recompile every time)
+    combined = re.compile("|".join(fnmatch.translate(f"*{pat.strip('*')}*") for pat in patterns))
+
+    # stream page by page - at most one page (and its values) in memory at a time
+    paginator = client.get_paginator("list_secrets")
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        for page in paginator.paginate(**paginate_opts):
+            matched = [secret for secret in page.get("SecretList", []) if combined.match(secret["Name"])]
+
+            # fetch secret values concurrently (each is an independent round-trip)
+            bodies = executor.map(lambda name: _get_secrets(client, name), [secret["Name"] for secret in matched])
+
+            for secret, body in zip(matched, bodies):
+                print(f"[[bold]{secret['Name']}[/bold]]")
+                if secret.get("Description"):
+                    print(f" DESCRIPTION: {secret['Description']}")
+                print(" VALUES:")
+                if isinstance(body, dict):
+                    for k, v in body.items():
+                        print(f"  - {k}: {v}")
+                else:
+                    print(f"  - {body}")
 
 
 # get secrets
@@ -112,25 +133,73 @@ def get_secrets(
     region_name: str = "ap-northeast-2",
     load_docker_secret: bool = True,
     session: boto3.Session = None,
+    use_cache: bool = True,
 ):
     """Get secrets from AWS SecretsManager.
 
+    Values are cached in-process (stale-while-revalidate, see aws.common) -
+    pass use_cache=False to force a round-trip. An explicit session always
+    bypasses the cache.
+
     Example
     -------
     >>> conf = get_secrets("some/secrets")
     """
 
     # get client
-    session = session or session_maker(
+    if session is not None:
+        client = session.client("secretsmanager", config=BOTO_CONFIG)
+        return _get_secrets(client, secret_name)
+
+    client = client_maker(
+        "secretsmanager",
         profile_name=profile_name,
         aws_access_key_id=aws_access_key_id,
         aws_secret_access_key=aws_secret_access_key,
         region_name=region_name,
         load_docker_secret=load_docker_secret,
     )
-    client = session.client("secretsmanager")
+    if not use_cache:
+        return _get_secrets(client, secret_name)
+
+    key = ("secretsmanager", secret_name, profile_name, region_name)
+    return swr_get(key, lambda: _get_secrets(client, secret_name))
 
-    return _get_secrets(client, secret_name)
+
+# get many secrets
+def get_secrets_many(
+    secret_names: list,
+    profile_name: str = None,
+    aws_access_key_id: str = None,
+    aws_secret_access_key: str = None,
+    region_name: str = "ap-northeast-2",
+    load_docker_secret: bool = True,
+    session: boto3.Session = None,
+):
+    """Get several secrets at once, sharing one client and fanning the round-trips out concurrently.
+
+    Example
+    -------
+    >>> confs = get_secrets_many(["some/secrets", "other/secrets"])
+    """
+
+    # get client
+    if session is not None:
+        client = session.client("secretsmanager", config=BOTO_CONFIG)
+    else:
+        client = client_maker(
+            "secretsmanager",
+            profile_name=profile_name,
+            aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key,
+            region_name=region_name,
+            load_docker_secret=load_docker_secret,
+        )
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        bodies = executor.map(lambda name: _get_secrets(client, name), secret_names)
+
+    return dict(zip(secret_names, bodies))
 
 
 # [DEPRECATED]
@@ -1,12 +1,13 @@
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Union
 
 import boto3
 from pydantic import BaseModel
 
 import logging
-from .common import session_maker, validate_response
+from .common import BOTO_CONFIG, session_maker, validate_response
 
 
 logger = logging.getLogger(__file__)
@@ -37,7 +38,7 @@ class ReturnedMessage(BaseModel):
 # list queues
 def list_queues(prefix=None, session=None, session_opts=None):
     session = session if session else session_maker(session_opts=session_opts)
-    client = session.client("sqs")
+    client = session.client("sqs", config=BOTO_CONFIG)
 
     paginate_opts = {
         "QueueNamePrefix": prefix,
@@ -76,13 +77,15 @@ def create_queue(
         queue가 생성된 것을 확인한 후에 response를 반환. (queue 생성은 주문 후 30초 이상 걸리기도 함.)
     """
     session = session if session else session_maker(session_opts=session_opts)
-    client = session.client("sqs")
+    client = session.client("sqs", config=BOTO_CONFIG)
 
-    _queues = list_queues(prefix=queue_name)
-    for _queue in _queues:
-        if _queue.rsplit("/", 1)[-1] == queue_name:
-            logger.warning(f"queue '{queue_name}' already exists!")
-            return
+    # targeted lookup instead of scanning every queue with the given prefix
+    try:
+        client.get_queue_url(QueueName=queue_name)
+        logger.warning(f"queue '{queue_name}' already exists!")
+        return
+    except client.exceptions.QueueDoesNotExist:
+        pass
 
     redrive_policy = {}
     if dlq_after_received > 0:
@@ -93,6 +96,7 @@ def create_queue(
             visibility_timeout=visibility_timeout,
             dlq_after_received=-1,
             wait_for_queue_to_ready_sec=60,
+            session=session,
         )
         dlq_url = get_queue_url(queue_name=dlq_name, session=session)
         response = client.get_queue_attributes(QueueUrl=dlq_url, AttributeNames=["QueueArn"])
@@ -149,10 +153,14 @@ def get_queue(
 ):
     session = session if session else session_maker(session_opts=session_opts)
     resource = session.resource("sqs")
+    client = session.client("sqs", config=BOTO_CONFIG)
 
-    for queue in resource.queues.all():
-        if queue.url.rsplit("/", 1)[-1] == queue_name:
-            return queue
+    # targeted lookup instead of iterating every queue in the account
+    try:
+        queue_url = client.get_queue_url(QueueName=queue_name)["QueueUrl"]
+        return resource.Queue(queue_url)
+    except client.exceptions.QueueDoesNotExist:
+        pass
 
     if create_if_not_exists:
         response = create_queue(
@@ -182,7 +190,7 @@ def set_queue_attributes(
     session_opts: dict = None,
 ):
     session = session if session else session_maker(session_opts=session_opts)
-    client = session.client("sqs")
+    client = session.client("sqs", config=BOTO_CONFIG)
 
     attributes = {
         "DelaySeconds": delay_seconds,
@@ -203,7 +211,7 @@ def set_queue_attributes(
         redrive_policy = {k: str(v) for k, v in redrive_policy.items() if v is not None}
 
     response = client.set_queue_attributes(
-        QueueUrl=get_queue_url(queue_name),
+        QueueUrl=get_queue_url(queue_name, session=session),
         Attributes=attributes,
     )
     _ = validate_response(response)
@@ -218,7 +226,7 @@ def get_queue_url(
     session_opts: dict = None,
 ):
     session = session if session else session_maker(session_opts=session_opts)
-    client = session.client("sqs")
+    client = session.client("sqs", config=BOTO_CONFIG)
 
     response = client.get_queue_url(QueueName=queue_name)
     _ = validate_response(response)
@@ -234,7 +242,7 @@ def delete_queue(
     session_opts: dict = None,
 ):
     session = session if session else session_maker(session_opts=session_opts)
-    client = session.client("sqs")
+    client = session.client("sqs", config=BOTO_CONFIG)
 
     if delete_dlq:
         queue = get_queue(queue_name=queue_name, create_if_not_exists=False, session=session)
@@ -245,9 +253,9 @@ def delete_queue(
             dlq_sources = list_dead_letter_source_queues(queue_name=_queue_name, session=session)
             if len(dlq_sources) > 1:
                 logger.warning(f"other queue uses '{_queue_name}' as DLQ, we'll not delete it!")
-            delete_queue(queue_name=_queue_name)
+            delete_queue(queue_name=_queue_name, session=session)
 
-    queue_url = get_queue_url(queue_name=queue_name)
+    queue_url = get_queue_url(queue_name=queue_name, session=session)
     response = client.delete_queue(QueueUrl=queue_url)
     _ = validate_response(response)
 
@@ -261,9 +269,9 @@ def purge_queue(
     session_opts: dict = None,
 ):
     session = session if session else session_maker(session_opts=session_opts)
-    client = session.client("sqs")
+    client = session.client("sqs", config=BOTO_CONFIG)
 
-    queue_url = get_queue_url(queue_name=queue_name)
+    queue_url = get_queue_url(queue_name=queue_name, session=session)
     response = client.purge_queue(QueueUrl=queue_url)
     _ = validate_response(response)
 
@@ -273,7 +281,7 @@ def purge_queue(
 # list dead letter source queues
 def list_dead_letter_source_queues(queue_name, session=None, session_opts=None):
     session = session if session else session_maker(session_opts=session_opts)
-    client = session.client("sqs")
+    client = session.client("sqs", config=BOTO_CONFIG)
 
     queue_url = get_queue_url(queue_name=queue_name, session=session)
 
@@ -309,7 +317,7 @@ class Queue:
 
         # props
         self.session = session if session else session_maker(session_opts)
-        self.client = self.session.client("sqs")
+        self.client = self.session.client("sqs", config=BOTO_CONFIG)
         self.resource = self.session.resource("sqs")
         self.queue = get_queue(queue_name=queue_name, session=self.session, create_if_not_exists=auto_create_queue)
         self.queue_url = get_queue_url(queue_name, session=self.session)
@@ -334,19 +342,32 @@ class Queue:
 
         raise ReferenceError("send messages FAILED!")
 
-    def receive_messages(self, message_attribute_names=["All"], max_number_of_messages=10, wait_time_seconds=1):
-        response = self.client.receive_message(
-            QueueUrl=self.queue_url,
-            MessageAttributeNames=message_attribute_names,
-            MaxNumberOfMessages=max_number_of_messages,
-            WaitTimeSeconds=wait_time_seconds,
-        )
-        _ = validate_response(response)
-        if "Messages" in response:
-            for msg in response["Messages"]:
-                print(msg)
-            return [ReturnedMessage(**msg) for msg in response["Messages"]]
-        return []
+    def receive_messages(
+        self, message_attribute_names=["All"], max_number_of_messages=10, wait_time_seconds=20, parallel_receivers=1
+    ):
+        # WaitTimeSeconds >= 1 enables long polling - the server holds the connection
+        # until a message arrives (or the wait elapses) instead of returning empty.
+        def _receive():
+            response = self.client.receive_message(
+                QueueUrl=self.queue_url,
+                MessageAttributeNames=message_attribute_names,
+                MaxNumberOfMessages=min(int(max_number_of_messages), 10),
+                WaitTimeSeconds=min(int(wait_time_seconds), 20),
+            )
+            _ = validate_response(response)
+            return response.get("Messages", [])
+
+        # a single receive_message is capped at 10 messages - fan out for more throughput
+        if parallel_receivers > 1:
+            with ThreadPoolExecutor(max_workers=parallel_receivers) as executor:
+                futures = [executor.submit(_receive) for _ in range(parallel_receivers)]
+                messages = [msg for future in futures for msg in future.result()]
+        else:
+            messages = _receive()
+
+        for msg in messages:
+            print(msg)
+        return [ReturnedMessage(**msg) for msg in messages]
 
     def delete_message(self, receipt_handle_or_message: Union[str, ReturnedMessage]):
         if isinstance(receipt_handle_or_message, ReturnedMessage):
@@ -355,6 +376,81 @@ class Queue:
         _ = validate_response(response)
         return response
 
+    def consume(
+        self,
+        handler,
+        handler_workers: int = 4,
+        max_number_of_messages: int = 10,
+        wait_time_seconds: int = 20,
+        parallel_receivers: int = 1,
+        max_polls: int = None,
+        poll_interval: int = 60,
+    ):
+        """Receive messages in a loop and dispatch them to 'handler'.
+
+        handler(message: ReturnedMessage) runs concurrently per batch, so
+        I/O-bound handlers scale with handler_workers. Messages whose handler
+        returns without raising are acked in one delete_message_batch call;
+        failed messages stay on the queue and reappear after the visibility
+        timeout. Set max_polls to stop after a fixed number of receives.
+        poll_interval caps the backoff between empty short polls.
+        """
+        polls = 0
+        empty_polls = 0
+        while max_polls is None or polls < max_polls:
+            polls += 1
+            messages = self.receive_messages(
+                max_number_of_messages=max_number_of_messages,
+                wait_time_seconds=wait_time_seconds,
+                parallel_receivers=parallel_receivers,
+            )
+            if not messages:
+                # with long polling the server already held the connection for
+                # wait_time_seconds; only short polling needs a client-side
+                # backoff (1s, 2s, 4s, ... capped at poll_interval)
+                if wait_time_seconds < 1:
+                    time.sleep(min(poll_interval, 2**empty_polls))
+                    empty_polls += 1
+                continue
+            empty_polls = 0
+
+            with ThreadPoolExecutor(max_workers=handler_workers) as executor:
+                futures = {executor.submit(handler, msg): msg for msg in messages}
+
+            to_delete = []
+            for future, msg in futures.items():
+                try:
+                    future.result()
+                except Exception as ex:
+                    logger.error(f"handler failed for message '{msg.MessageId}': {ex}")
+                else:
+                    to_delete.append(msg)
+            if to_delete:
+                self.delete_messages(to_delete)
+
+    def delete_messages(self, receipt_handles_or_messages: list):
+        if not isinstance(receipt_handles_or_messages, (tuple, list)):
+            raise ValueError("input 'receipt_handles_or_messages' should be a list!")
+
+        receipt_handles = [
+            x.ReceiptHandle if isinstance(x, ReturnedMessage) else x for x in receipt_handles_or_messages
+        ]
+
+        # delete_message_batch accepts at most 10 entries per call
+        responses = []
+        for offset in range(0, len(receipt_handles), 10):
+            entries = [
+                {"Id": str(i), "ReceiptHandle": handle}
+                for i, handle in enumerate(receipt_handles[offset : offset + 10])
+            ]
+            response = self.client.delete_message_batch(QueueUrl=self.queue_url, Entries=entries)
+            _ = validate_response(response)
+            if response.get("Failed"):
+                logger.warning(f"delete {len(entries)} messages, {len(response['Failed'])} messages are failed!")
+            responses.append(response)
+
+        return responses
+
     def purge_queue(self):
         response = self.client.purge_queue(QueueUrl=self.queue_url)
         _ = validate_response(response)
@@ -1,12 +1,18 @@
 import fnmatch
 import json
 import logging
+import re
 from typing import Union
 
 import boto3
-from rich import print
 
-from .common import session_maker
+from .common import BOTO_CONFIG, client_maker, swr_get
+
+# orjson is ~2-5x faster than stdlib json and raises a json.JSONDecodeError subclass
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
 
 logger = logging.getLogger()
 
@@ -37,28 +43,50 @@ def list_parameters(
     Returns:
         list: list of parameters
     """
+    # lazy - rich (and its transitive pygments) is only needed for pretty listing
+    from rich import print
+
     # correct args
     patterns = patterns or "*"
     if patterns:
         patterns = patterns if isinstance(patterns, (tuple, list)) else [patterns]
 
     # get client
-    session = session or session_maker()
-    client = session.client("ssm")
+    client = session.client("ssm", config=BOTO_CONFIG) if session is not None else client_maker("ssm")
 
     parameter_filters = [{"Key": "Name", "Option": "BeginsWith", "Values": [f"/{PS_PREFIX}"]}]
-    resp = client.describe_parameters(ParameterFilters=parameter_filters)
+    paginator = client.get_paginator("describe_parameters")
+    parameters = [
+        param
+        for page in paginator.paginate(ParameterFilters=parameter_filters)
+        for param in page.get("Parameters", [])
+    ]
+
+    # fetch all values at once - one get_parameters_by_path call per 10 parameters, not one get_parameter each
+    paginator = client.get_paginator("get_parameters_by_path")
+    values_by_name = {
+        p["Name"]: p["Value"]
+        for page in paginator.paginate(Path=f"/{PS_PREFIX}", WithDecryption=True, Recursive=True)
+        for p in page.get("Parameters", [])
+    }
 
-    for param in resp["Parameters"]:
+    # one compiled regex instead of per-item fnmatch calls (which recompile every time)
+    combined = re.compile("|".join(fnmatch.translate(f"*{pat.strip('*')}*") for pat in patterns))
+
+    for param in parameters:
         _, name = param["Name"].strip("/").split("/")
-        if not any([fnmatch.fnmatch(name, f"*{pat.strip('*')}*") for pat in patterns]):
+        if not combined.match(name):
             continue
         print(f"[[bold]{name}[/bold]]")
         if param.get("Description"):
             print(f" DESCRIPTION: {param['Description']}")
         print(f""" SSM NAME: '{param["Name"]}'""")
         print(" VALUES:")
-        values = get_parameters(name)
+        values = values_by_name.get(param["Name"])
+        try:
+            values = _json.loads(values)
+        except (json.JSONDecodeError, TypeError):
+            pass
         if isinstance(values, dict):
             for k, v in values.items():
                 print(f"  - {k}: {v}")
@@ -89,8 +117,7 @@ def set_parameters(
         ClutterAWSException
     """
     # get client
-    session = session or session_maker()
-    client = session.client("ssm")
+    client = session.client("ssm", config=BOTO_CONFIG) if session is not None else client_maker("ssm")
 
     opts = {
         "Type": "SecureString",
@@ -99,10 +126,7 @@ def set_parameters(
     if description:
         opts.update({"Description": description})
     if tags:
-        Tags = []
-        for k, v in tags.items():
-            tags.append({"Key": k, "Value": v})
-        opts.update({"Tags": Tags})
+        opts.update({"Tags": [{"Key": k, "Value": v} for k, v in tags.items()]})
 
     resp = client.put_parameter(
         Name=f"/{PS_PREFIX}/{name}",
@@ -115,23 +139,33 @@ def set_parameters(
 
 
 # get parameters
-def get_parameters(name: str, session: boto3.Session = None) -> Union[dict, str]:
+def get_parameters(name: str, session: boto3.Session = None, use_cache: bool = True) -> Union[dict, str]:
     """Get Parameters from AWS Parameter Store.
 
     Args:
         name (str): name of parameters
         session (boto3.Session, optional): create new session if None. Defaults to None.
+        use_cache (bool, optional): serve from the in-process SWR cache (see aws.common). Defaults to True.
 
     Returns:
         Union[dict, str]: parameters.
     """
-    session = session or session_maker()
-    client = session.client("ssm")
-
-    Name = f"/{PS_PREFIX}/{name}"
-    resp = client.get_parameter(Name=Name, WithDecryption=True)
-    values = resp["Parameter"]["Value"]
-    try:
-        return json.loads(values)
-    except json.JSONDecodeError as exc:
+    client = session.client("ssm", config=BOTO_CONFIG) if session is not None else client_maker("ssm")
+
+    def _fetch():
+        resp = client.get_parameter(Name=f"/{PS_PREFIX}/{name}", WithDecryption=True)
+        values = resp["Parameter"]["Value"]
+        # cheap sniff on the first byte - plain strings skip the decode
+        # attempt entirely instead of paying for a raised JSONDecodeError
+        head = values.lstrip()[:1]
+        if head and head in '{["0123456789-tfn':
+            try:
+                return _json.loads(values)
+            except json.JSONDecodeError:
+                pass
         return values
+
+    if session is not None or not use_cache:
+        return _fetch()
+
+    return swr_get(("ssm", name), _fetch)